@@ -1,32 +1,110 @@
 #!/usr/bin/env python3
 
 import argparse
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import json
+from operator import itemgetter
+import os
 from pathlib import Path
-import requests
+import sys
+import threading
+import time
+from urllib.parse import urlencode
+
+MAX_WORKERS = 16
+TIMEOUT = (3.05, 10)  # (connect, read) seconds
+
+# Seconds a cached response stays fresh
+PRICE_TTL = 30
+KLINES_TTL = 300
+ATH_TTL = 3600
+
+# Table layouts, built once at import
+ATH_ROW_FORMAT = "{symbol:<8}{ath:>15}{current:>15}{change:>20}"
+ATH_HEADER = ATH_ROW_FORMAT.format(symbol='Symbol', ath='ATH', current='Current Price',
+                                   change='Change from ATH (%)')
+ATH_TITLE = '--- All-Time Highs ---'.ljust(len(ATH_HEADER))
+
+PRICES_WALLET_WIDTH = 15
+PRICES_ROW_FORMAT = ("{symbol:<8}{open:>12}{current:>15}{change:>12}"
+                     f"{{wallet:>{PRICES_WALLET_WIDTH}}}")
+PRICES_HEADER = PRICES_ROW_FORMAT.format(symbol='Symbol', open='Open Price', current='Current Price',
+                                         change='Change (%)', wallet='Wallet Value')
+# Total value lines up under the wallet column; the label spans the columns before it
+PRICES_TOTAL_FORMAT = (f"{{label:<{len(PRICES_HEADER) - PRICES_WALLET_WIDTH}}}"
+                       f"{{value:>{PRICES_WALLET_WIDTH}}}")
+
+# Shared session so requests reuse pooled keep-alive connections
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+# Network errors that fall back to the cache, filled in by get_session()
+_NETWORK_ERRORS = ()
+
+def write_json_atomically(file_path, data, **kwargs):
+    """
+    Write `data` as JSON to `file_path` through a temp file and os.replace().
+
+    The temp name includes the PID so concurrent runs never share one, and a
+    failed write leaves the original file untouched with no temp file behind.
+
+    Args:
+        file_path (Path): The destination file.
+        data: JSON-serialisable data.
+        **kwargs: Passed through to json.dump (e.g., indent).
+    """
+    tmp_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open('w') as file:
+            json.dump(data, file, **kwargs)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            tmp_path.unlink(missing_ok=True)
+        raise
 
 class Wallet:
-    """Handles wallet loading and saving."""
+    """
+    Handles wallet loading and saving.
+
+    Changes are kept in memory until `commit()` is called, or until the
+    `with Wallet(...) as wallet:` block exits without an exception.
+    """
     def __init__(self, file_path):
         self.file_path = Path(file_path)
         self.data = self._load()
+        self._dirty = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.commit()
+        return False
 
     def _load(self):
         """Load wallet data from a file."""
-        if self.file_path.exists():
+        try:
             with self.file_path.open('r') as file:
                 return json.load(file)
-        return {}
+        except FileNotFoundError:
+            return {}
 
-    def save(self):
-        """Save wallet data to the file."""
-        with self.file_path.open('w') as file:
-            json.dump(self.data, file, indent=4)
+    def commit(self):
+        """Write wallet data to the file atomically, if it has changed."""
+        if not self._dirty:
+            return
+        write_json_atomically(self.file_path, self.data, indent=4)
+        self._dirty = False
+
+    # Kept for callers of the original API
+    save = commit
 
     def update(self, symbol, amount):
         """Update the wallet with a new symbol and amount."""
         self.data[symbol] = amount
-        self.save()
+        self._dirty = True
 
     def clear(self, symbol=None):
         """
@@ -38,13 +116,13 @@ class Wallet:
         if symbol:
             if symbol in self.data:
                 del self.data[symbol]
-                self.save()
+                self._dirty = True
                 print(f"Cleared {symbol} from wallet.")
             else:
                 print(f"Symbol '{symbol}' not found in wallet.")
         else:
             self.data = {}
-            self.save()
+            self._dirty = True
             print("Cleared entire wallet.")
 
     def get(self, symbol):
@@ -55,35 +133,157 @@ class Wallet:
         """Return all symbols in the wallet."""
         return list(self.data.keys())
 
-def fetch_price_data(symbol, interval=None):
+class ResponseCache:
+    """Caches API responses on disk so repeated runs can skip the network."""
+    def __init__(self, file_path):
+        self.file_path = Path(file_path)
+        self.data = None
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        """Load cached responses from a file, discarding it if missing or unreadable."""
+        try:
+            with self.file_path.open('r') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """
+        Save cached responses to the file atomically, if any were added.
+
+        The cache is only an optimisation, so a failed write warns on stderr
+        instead of raising.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            try:
+                write_json_atomically(self.file_path, self.data)
+            except OSError as e:
+                print(f"Warning: could not save response cache to {self.file_path}: {e}",
+                      file=sys.stderr)
+                return
+            self._dirty = False
+
+    def get(self, key, ttl):
+        """Get a cached response if it is younger than `ttl` seconds, else None."""
+        stale = self.get_stale(key)
+        if stale and stale[1] < ttl:
+            return stale[0]
+        return None
+
+    def get_stale(self, key):
+        """Get a cached response of any age as (value, age in seconds), else None."""
+        with self._lock:
+            if self.data is None:
+                self.data = self._load()
+            entry = self.data.get(key)
+        if entry:
+            return entry['value'], time.time() - entry['time']
+        return None
+
+    def set(self, key, value):
+        """Store a response in the cache."""
+        with self._lock:
+            if self.data is None:
+                self.data = self._load()
+            self.data[key] = {'time': time.time(), 'value': value}
+            self._dirty = True
+
+_CACHE = ResponseCache('.binance_cache.json')
+
+def get_session():
     """
-    Fetch price data from Binance.
+    Return the shared HTTP session, creating it on first use.
 
-    API documentation: https://developers.binance.com/docs/derivatives/coin-margined-futures/market-data/Kline-Candlestick-Data
+    requests is imported here so wallet-only commands never load the HTTP stack.
+    """
+    global _SESSION, _NETWORK_ERRORS
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            # No read retries, so a stalled response hits the cache fallback after one timeout
+            retry = Retry(total=3, read=0, backoff_factor=0.2)
+            _SESSION = requests.Session()
+            _SESSION.mount('https://', HTTPAdapter(pool_connections=MAX_WORKERS,
+                                                   pool_maxsize=MAX_WORKERS,
+                                                   max_retries=retry))
+            # Exhausted read retries surface as ConnectionError rather than Timeout
+            _NETWORK_ERRORS = (requests.Timeout, requests.ConnectionError)
+    return _SESSION
+
+def get_json(url, params=None, ttl=0):
+    """
+    GET a Binance endpoint and return the decoded JSON, using the cache when fresh.
+
+    If the request times out or cannot connect, a stale cached response is
+    returned when one exists, with a warning on stderr giving its age.
 
     Args:
-        symbol (str): The trading pair symbol (e.g., BTCUSDT).
-        interval (str): If provided, fetches kline data for the given interval.
+        url (str): The endpoint URL.
+        params (dict, optional): Query parameters.
+        ttl (int): Seconds a cached response may be reused; 0 disables caching.
 
     Returns:
-        float or tuple: Current price if no interval; (open price, percent change) otherwise.
+        The decoded JSON response.
     """
-    if interval:
-        url = 'https://api.binance.com/api/v3/klines'
-        params = {'symbol': symbol, 'interval': interval, 'limit': 2}
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        data = response.json()
-        open_yesterday = float(data[0][1])
-        open_today = float(data[1][1])
-        percent_change = (open_today - open_yesterday) / open_yesterday
-        return open_today, percent_change
-    else:
-        url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
-        response = requests.get(url)
+    query = urlencode(sorted((params or {}).items()))
+    key = f"{url}?{query}" if query else url
+    data = _CACHE.get(key, ttl) if ttl else None
+    if data is None:
+        session = get_session()
+        try:
+            response = session.get(url, params=params, timeout=TIMEOUT)
+        except _NETWORK_ERRORS as e:
+            stale = _CACHE.get_stale(key)
+            if stale is None:
+                raise
+            data, age = stale
+            print(f"Warning: {key} failed ({type(e).__name__}); using cached response from {age:.0f}s ago",
+                  file=sys.stderr)
+            return data
         response.raise_for_status()
         data = response.json()
-        return float(data['price'])
+        if ttl:
+            _CACHE.set(key, data)
+    return data
+
+def fetch_price_data(symbol, interval):
+    """
+    Fetch kline price data from Binance. Current prices come from fetch_all_prices().
+
+    API documentation: https://developers.binance.com/docs/derivatives/coin-margined-futures/market-data/Kline-Candlestick-Data
+
+    Args:
+        symbol (str): The trading pair symbol (e.g., BTCUSDT).
+        interval (str): The kline interval (e.g., "1d").
+
+    Returns:
+        tuple: (open price, percent change) for the latest candle.
+    """
+    url = 'https://api.binance.com/api/v3/klines'
+    params = {'symbol': symbol, 'interval': interval, 'limit': 2}
+    data = get_json(url, params, ttl=KLINES_TTL)
+    open_yesterday = float(data[0][1])
+    open_today = float(data[1][1])
+    percent_change = (open_today - open_yesterday) / open_yesterday
+    return open_today, percent_change
+
+def fetch_all_prices():
+    """
+    Fetch the current price of every ticker on Binance in a single request.
+
+    Returns:
+        dict: Maps trading pair symbol (e.g., BTCUSDT) to current price.
+    """
+    url = 'https://api.binance.com/api/v3/ticker/price'
+    data = get_json(url, ttl=PRICE_TTL)
+    return {ticker['symbol']: float(ticker['price']) for ticker in data}
 
 def fetch_all_time_high(symbol):
     """
@@ -97,10 +297,30 @@ def fetch_all_time_high(symbol):
     """
     url = 'https://api.binance.com/api/v3/klines'
     params = {'symbol': f'{symbol}USDT', 'interval': '1M'}  # 1M = 1-month candles
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    data = response.json()
-    return max(float(candle[2]) for candle in data)  # High price is at index 2
+    data = get_json(url, params, ttl=ATH_TTL)
+    return max(map(float, map(itemgetter(2), data)))  # High price is at index 2
+
+def fetch_concurrently(tasks):
+    """
+    Run fetch calls concurrently in a thread pool, submitted in `tasks` order.
+
+    Args:
+        tasks (dict): Maps a key to a (function, args) tuple.
+
+    Returns:
+        tuple: (results, errors), both dicts keyed like `tasks`.
+    """
+    results = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(func, *args): key for key, (func, args) in tasks.items()}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                errors[key] = e
+    return results, errors
 
 def print_all_time_highs(symbols, unit):
     """
@@ -110,37 +330,37 @@ def print_all_time_highs(symbols, unit):
         symbols (list): List of cryptocurrency symbols.
         unit (str): The trading pair unit (e.g., "USDT").
     """
-    format = {
-        'symbol': 8,
-        'ath': 15,
-        'current': 15,
-        'change': 20,
-    }
-    format['line'] = sum(value for value in format.values())
-
-    print(f"\n{'--- All-Time Highs ---'.ljust(format['line'])}")
-    print(f"{'Symbol'.ljust(format['symbol'])}" +
-          f"{'ATH'.rjust(format['ath'])}" +
-          f"{'Current Price'.rjust(format['current'])}" +
-          f"{'Change from ATH (%)'.rjust(format['change'])}")
-    print('-' * format['line'])
+    rows = [f"\n{ATH_TITLE}", ATH_HEADER, '-' * len(ATH_HEADER)]
+
+    # Fetch all current prices (the largest response, so submitted first) and every ATH at once
+    tasks = {'prices': (fetch_all_prices, ())}
+    for symbol in symbols:
+        tasks[(symbol, 'ath')] = (fetch_all_time_high, (symbol,))
+    results, errors = fetch_concurrently(tasks)
+    _CACHE.save()
+    prices = results.get('prices', {})
 
     for symbol in symbols:
+        pair = f"{symbol}{unit}"
         try:
-            # Fetch ATH and current price
-            ath = fetch_all_time_high(symbol)
-            current_price = fetch_price_data(f"{symbol}{unit}")
+            ath = results[(symbol, 'ath')]
+            current_price = prices[pair]
 
             # Calculate percentage change from ATH
             ath_change = ((current_price - ath) / ath) * 100
 
             # Print values
-            print(f"{symbol.ljust(format['symbol'])}" +
-                  f"{f'${ath:.2f}'.rjust(format['ath'])}" +
-                  f"{f'${current_price:.2f}'.rjust(format['current'])}" +
-                  f"{f'{ath_change:.2f}%'.rjust(format['change'])}")
+            rows.append(ATH_ROW_FORMAT.format(symbol=symbol, ath=f'${ath:.2f}',
+                                              current=f'${current_price:.2f}',
+                                              change=f'{ath_change:.2f}%'))
         except Exception as e:
-            print(f"Error fetching data for {symbol}: {e}")
+            # A missing result means its fetch failed; report that error instead
+            error = errors.get((symbol, 'ath')) or errors.get('prices') or e
+            if isinstance(error, KeyError):
+                error = f"no price for {pair}"
+            print(f"Error fetching data for {symbol}: {error}", file=sys.stderr)
+
+    sys.stdout.write("\n".join(rows) + "\n")
 
 def print_prices(symbols, unit, wallet=None):
     """
@@ -151,50 +371,47 @@ def print_prices(symbols, unit, wallet=None):
         unit (str): The trading pair unit (e.g., "USDT").
         wallet (Wallet, optional): Wallet instance for calculating wallet value.
     """
-    format = {
-        'symbol': 8,
-        'open': 12,
-        'current': 15,
-        'change': 12,
-        'wallet': 15,
-    }
-    format['line'] = sum(value for value in format.values())
-
-    print(f"\n--- Prices ---")
-    print(f"{'Symbol'.ljust(format['symbol'])}" +
-          f"{'Open Price'.rjust(format['open'])}" +
-          f"{'Current Price'.rjust(format['current'])}" +
-          f"{'Change (%)'.rjust(format['change'])}" +
-          f"{'Wallet Value'.rjust(format['wallet'])}")
-    print('-' * format['line'])
+    rows = ["\n--- Prices ---", PRICES_HEADER, '-' * len(PRICES_HEADER)]
+
+    # Fetch all current prices (the largest response, so submitted first) and every open at once,
+    # skipping the network entirely for an empty wallet
+    tasks = {'prices': (fetch_all_prices, ())} if symbols else {}
+    for symbol in symbols:
+        tasks[(symbol, 'open')] = (fetch_price_data, (f"{symbol}{unit}", '1d'))
+    results, errors = fetch_concurrently(tasks)
+    _CACHE.save()
+    prices = results.get('prices', {})
 
     total_value = 0
 
-    wallet = Wallet('wallet.json')
     for symbol in symbols:
+        pair = f"{symbol}{unit}"
         try:
-            daily_open, _ = fetch_price_data(f"{symbol}{unit}", interval='1d')
-            current_price = fetch_price_data(f"{symbol}{unit}")
+            daily_open, _ = results[(symbol, 'open')]
+            current_price = prices[pair]
             percent_change = ((current_price - daily_open) / daily_open) * 100
 
-            wallet_value = wallet.get(symbol)
-            if wallet:
-                amount = wallet.get(symbol)
-                wallet_value = amount * current_price
-                total_value += wallet_value
-
-            print(f"{symbol.ljust(format['symbol'])}" +
-                  f"{f'${daily_open:.2f}'.rjust(format['open'])}" +
-                  f"{f'${current_price:.2f}'.rjust(format['current'])}" +
-                  f"{f'{percent_change:.2f}%'.rjust(format['change'])}" +
-                  f"{f'${wallet_value:.2f}'.rjust(format['wallet'])}")
+            amount = wallet.get(symbol) if wallet else 0
+            wallet_value = amount * current_price
+            total_value += wallet_value
+
+            rows.append(PRICES_ROW_FORMAT.format(symbol=symbol, open=f'${daily_open:.2f}',
+                                                 current=f'${current_price:.2f}',
+                                                 change=f'{percent_change:.2f}%',
+                                                 wallet=f'${wallet_value:.2f}'))
         except Exception as e:
-            print(f"Error fetching data for {symbol}: {e}")
+            # A missing result means its fetch failed; report that error instead
+            error = errors.get((symbol, 'open')) or errors.get('prices') or e
+            if isinstance(error, KeyError):
+                error = f"no price for {pair}"
+            print(f"Error fetching data for {symbol}: {error}", file=sys.stderr)
 
     if wallet:
-        print('-' * format['line'])
-        print(f"{'Total Wallet Value:'.ljust(format['line'] - format['wallet'])}" +
-              f"{f'${total_value:.2f}'.rjust(format['wallet'])}")
+        rows.append('-' * len(PRICES_HEADER))
+        rows.append(PRICES_TOTAL_FORMAT.format(label='Total Wallet Value:',
+                                               value=f'${total_value:.2f}'))
+
+    sys.stdout.write("\n".join(rows) + "\n")
 
 def main():
     """Main program logic."""
@@ -210,7 +427,6 @@ def main():
 
     args = parser.parse_args()
 
-    wallet = Wallet('wallet.json')
     symbols = ['BTC', 'ETH', 'LINK', 'DOT', 'ADA']
     unit = 'USDT'
 
@@ -219,17 +435,20 @@ def main():
         print_all_time_highs(symbols, unit)
     elif args.wallet == 'update':
         if args.symbol and args.amount is not None:
-            wallet.update(args.symbol, args.amount)
+            with Wallet('wallet.json') as wallet:
+                wallet.update(args.symbol, args.amount)
             print(f"Updated wallet: {args.symbol} = {args.amount}")
         else:
             print("Error: Must provide SYMBOL and AMOUNT to update the wallet.")
     elif args.wallet == 'show':
+        wallet = Wallet('wallet.json')
         print_prices(wallet.symbols(), unit, wallet)
     elif args.wallet == 'clear':
-        if args.symbol:
-            wallet.clear(args.symbol)
-        else:
-            wallet.clear()
+        with Wallet('wallet.json') as wallet:
+            if args.symbol:
+                wallet.clear(args.symbol)
+            else:
+                wallet.clear()
     else:
         print_prices(symbols, unit)
 
@@ -1,8 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+MAX_WORKERS = 16
+
+# Shared session so requests reuse pooled keep-alive connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS,
+                                       max_retries=Retry(total=3, read=0, backoff_factor=0.2)))
 
 def get_binance_price(symbol):
     url = f"https://api.binance.com/api/v3/ticker/price?symbol={symbol}"
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=(3.05, 10))
     data = response.json()
 
     return data['price']
@@ -15,8 +25,10 @@ def display_prices(symbols, unit):
     print(header)
     print('-' * len(header))
 
-    for symbol in symbols:
-        price = get_binance_price(f'{symbol}{unit}')
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(symbols)) or 1) as executor:
+        prices = executor.map(get_binance_price, [f'{symbol}{unit}' for symbol in symbols])
+
+    for symbol, price in zip(symbols, prices):
         print(f"{symbol.ljust(align['left'])} {f'${float(price):.2f}'.rjust(align['right'])}")
 
     return